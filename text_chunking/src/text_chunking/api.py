@@ -1,9 +1,11 @@
 """API layer powering UX/CLI."""
 from __future__ import annotations
 
-import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from .chunking import (
     ChunkingPolicy,
@@ -11,32 +13,49 @@ from .chunking import (
     SlidingWindowChunker,
     WholeDocumentChunker,
 )
-from .corpus import CorpusManager, DocumentRecord
-from .embeddings import HashedEmbeddingModel, SentenceTransformerEmbeddingModel
+from .corpus import CorpusManager, DocumentRecord, _json_dumps, _json_loads
+from .embeddings import (
+    EmbeddingModel,
+    HashedEmbeddingModel,
+    SentenceTransformerEmbeddingModel,
+)
 from .index import IndexManager, IndexStatus, VectorIndex
 
 
 class IndexingService:
     """Facade bundling corpus, chunkers, and indexes."""
 
+    # Parsed manifests shared by every service in the process, keyed by path
+    # and validated against the file's (mtime_ns, size).
+    _manifest_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, object]]] = {}
+
     def __init__(self, corpus_root: Path) -> None:
         self.corpus = CorpusManager(corpus_root)
         self.index_manager = IndexManager()
-        self._models = {
-            "text-mini": SentenceTransformerEmbeddingModel(
+        # Models are built on first use so commands that never embed
+        # (list/status/reset) skip the wrapper setup entirely.
+        self._model_factories: Dict[str, Callable[[], EmbeddingModel]] = {
+            "text-mini": lambda: SentenceTransformerEmbeddingModel(
                 "text-mini", "sentence-transformers/all-MiniLM-L6-v2"
             ),
-            "text-e5": SentenceTransformerEmbeddingModel(
+            "text-e5": lambda: SentenceTransformerEmbeddingModel(
                 "text-e5", "intfloat/e5-small-v2"
             ),
-            "text-bge": SentenceTransformerEmbeddingModel(
+            "text-bge": lambda: SentenceTransformerEmbeddingModel(
                 "text-bge", "BAAI/bge-small-en-v1.5"
             ),
-            "text-hash": HashedEmbeddingModel("text-hash"),
+            "text-hash": lambda: HashedEmbeddingModel("text-hash"),
         }
+        self._models: Dict[str, EmbeddingModel] = {}
+        # Chunkers are stateless, so one instance per configuration is shared.
+        self._policy_cache: Dict[Tuple[str, int, int], ChunkingPolicy] = {}
         self.index_dir = self.corpus.root / "indexes"
         self.index_dir.mkdir(parents=True, exist_ok=True)
         self._manifests: Dict[str, Dict[str, object]] = {}
+        # Loaded indexes keyed by name, tagged with the manifest mtime_ns they
+        # were loaded from so a rebuilt manifest triggers a reload.
+        self._loaded: Dict[str, Tuple[int, VectorIndex]] = {}
+        self._load_lock = threading.Lock()
         self._load_manifests()
 
     # ------------------------------------------------------------------
@@ -53,6 +72,12 @@ class IndexingService:
             doc_id, path, kind, tags=tags, description=description
         )
 
+    def register_local_bulk(
+        self, entries: Iterable[Tuple[str, Path, str, Optional[str]]]
+    ) -> List[DocumentRecord]:
+        """Register many ``(doc_id, path, kind, description)`` files in one save."""
+        return self.corpus.register_local_files(entries)
+
     def register_url(
         self,
         doc_id: str,
@@ -80,25 +105,38 @@ class IndexingService:
         window_chars: Optional[int] = None,
         overlap_chars: Optional[int] = None,
     ) -> ChunkingPolicy:
-        lookup = {
-            "sliding": SlidingWindowChunker(
-                window_chars=window_chars or SlidingWindowChunker.DEFAULT_WINDOW_CHARS,
-                overlap_chars=overlap_chars
-                or SlidingWindowChunker.DEFAULT_OVERLAP_CHARS,
+        if name == "sliding":
+            window = window_chars or SlidingWindowChunker.DEFAULT_WINDOW_CHARS
+            overlap = overlap_chars or SlidingWindowChunker.DEFAULT_OVERLAP_CHARS
+        else:
+            window = overlap = 0
+        key = (name, window, overlap)
+        policy = self._policy_cache.get(key)
+        if policy is not None:
+            return policy
+        factories: Dict[str, Callable[[], ChunkingPolicy]] = {
+            "sliding": lambda: SlidingWindowChunker(
+                window_chars=window, overlap_chars=overlap
             ),
-            "paragraph": ParagraphChunker(),
-            "document": WholeDocumentChunker(),
+            "paragraph": ParagraphChunker,
+            "document": WholeDocumentChunker,
         }
         try:
-            return lookup[name]
+            factory = factories[name]
         except KeyError as exc:
             raise KeyError(f"Unknown policy: {name}") from exc
+        policy = self._policy_cache[key] = factory()
+        return policy
 
-    def _resolve_model(self, name: str):
-        try:
-            return self._models[name]
-        except KeyError as exc:
-            raise KeyError(f"Unknown model: {name}") from exc
+    def _resolve_model(self, name: str) -> EmbeddingModel:
+        model = self._models.get(name)
+        if model is None:
+            try:
+                factory = self._model_factories[name]
+            except KeyError as exc:
+                raise KeyError(f"Unknown model: {name}") from exc
+            model = self._models[name] = factory()
+        return model
 
     def _default_index_name(self, model: str, policy: str) -> str:
         return f"{model}_{policy}"
@@ -108,31 +146,76 @@ class IndexingService:
         return self.index_dir / f"{name}.json"
 
     def _load_manifests(self) -> None:
-        for path in self.index_dir.glob("*.json"):
-            payload = json.loads(path.read_text())
+        cache = IndexingService._manifest_cache
+        found: List[Tuple[Path, Tuple[int, int]]] = []
+        with os.scandir(self.index_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    found.append((Path(entry.path), (stat.st_mtime_ns, stat.st_size)))
+        stale = [path for path, key in found if cache.get(path, (None,))[0] != key]
+        if stale:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                blobs = list(pool.map(Path.read_bytes, stale))
+            fresh = dict(found)
+            for path, blob in zip(stale, blobs):
+                cache[path] = (fresh[path], _json_loads(blob))
+        for path, _ in found:
+            payload = dict(cache[path][1])
             name = payload["name"]
             model_name = payload.get("model")
-            if model_name not in self._models:
+            if model_name not in self._model_factories:
+                cache.pop(path, None)
                 path.unlink(missing_ok=True)
                 continue
             self._manifests[name] = payload
 
     def _write_manifest(self, name: str, manifest: Dict[str, object]) -> None:
         self._manifests[name] = manifest
-        self._manifest_path(name).write_text(json.dumps(manifest, indent=2))
+        self._manifest_path(name).write_bytes(_json_dumps(manifest))
 
     def _delete_manifest(self, name: str) -> None:
-        self._manifests.pop(name, None)
+        manifest = self._manifests.pop(name, None) or {}
+        for key in ("hnsw_path", "records_path"):
+            if manifest.get(key):
+                (self.index_dir / str(manifest[key])).unlink(missing_ok=True)
         path = self._manifest_path(name)
         if path.exists():
             path.unlink()
 
+    def _chunk_documents(
+        self, policy: ChunkingPolicy, documents: Iterable[str]
+    ) -> List[Tuple[str, int, str]]:
+        return [
+            (doc_id, order, chunk_text)
+            for doc_id in documents
+            for order, chunk_text in enumerate(
+                policy.chunk(self.corpus.load_content(doc_id))
+            )
+        ]
+
     def _ensure_index_loaded(self, name: str) -> VectorIndex:
-        if name in self.index_manager:
-            return self.index_manager._indexes[name]
-        manifest = self._manifests.get(name)
-        if not manifest:
-            raise KeyError(f"Unknown index: {name}")
+        try:
+            mtime = self._manifest_path(name).stat().st_mtime_ns
+        except FileNotFoundError:
+            raise KeyError(f"Unknown index: {name}") from None
+        cached = self._loaded.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with self._load_lock:
+            cached = self._loaded.get(name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            # Missing or stale: re-read the manifest in case another process
+            # rebuilt the index, then load it from scratch.
+            self._manifests[name] = _json_loads(self._manifest_path(name).read_bytes())
+            self.index_manager.reset(name)
+            index = self._load_index(name)
+            self._loaded[name] = (mtime, index)
+            return index
+
+    def _load_index(self, name: str) -> VectorIndex:
+        manifest = self._manifests[name]
         policy_name = manifest["policy"]
         model_name = manifest["model"]
         documents = manifest.get("documents", [])
@@ -144,13 +227,22 @@ class IndexingService:
         )
         model_obj = self._resolve_model(model_name)
         index = self.index_manager.get_or_create(name, policy=policy_obj, model=model_obj)
-        for doc_id in documents:
-            text = self.corpus.load_content(doc_id)
-            index.add_document(
-                doc_id,
-                text,
-                metadata={"policy": policy_name, "model": model_name},
+        records_path = manifest.get("records_path")
+        # Older builds stored records as pickled .npz; those are re-embedded.
+        if (
+            records_path
+            and str(records_path).endswith(".records")
+            and (self.index_dir / records_path).exists()
+        ):
+            index.load(
+                self.index_dir / str(manifest["hnsw_path"]),
+                self.index_dir / str(records_path),
             )
+            return index
+        index.add_many(
+            self._chunk_documents(policy_obj, documents),
+            metadata={"policy": policy_name, "model": model_name},
+        )
         return index
 
     def build_index(
@@ -176,16 +268,24 @@ class IndexingService:
         target_docs = list(
             documents or [doc.doc_id for doc in self.corpus.list_documents()]
         )
-        for doc_id in target_docs:
-            text = self.corpus.load_content(doc_id)
-            index.add_document(
-                doc_id, text, metadata={"policy": policy, "model": model}
-            )
+        index.add_many(
+            self._chunk_documents(policy_obj, target_docs),
+            metadata={"policy": policy, "model": model},
+        )
+        hnsw_path = f"{index_name}.hnsw"
+        # JSON content, but not a .json name: every *.json here is a manifest.
+        records_path = f"{index_name}.records"
+        index.save(self.index_dir / hnsw_path, self.index_dir / records_path)
+        status = index.status()
         manifest = {
             "name": index_name,
             "model": model,
             "policy": policy,
             "documents": target_docs,
+            "hnsw_path": hnsw_path,
+            "records_path": records_path,
+            "documents_count": status.documents,
+            "chunks_count": status.chunks,
             "chunk_config": (
                 {
                     "window_chars": policy_obj.window_chars,
@@ -196,7 +296,11 @@ class IndexingService:
             ),
         }
         self._write_manifest(index_name, manifest)
-        return index.status()
+        self._loaded[index_name] = (
+            self._manifest_path(index_name).stat().st_mtime_ns,
+            index,
+        )
+        return status
 
     # ------------------------------------------------------------------
     def query(
@@ -207,26 +311,61 @@ class IndexingService:
         top_k: int = 5,
         min_score: Optional[float] = None,
     ) -> List[Tuple[float, Dict[str, str]]]:
+        return self.query_many(index_name, [text], top_k=top_k, min_score=min_score)[0]
+
+    def query_many(
+        self,
+        index_name: str,
+        texts: List[str],
+        *,
+        top_k: int = 5,
+        min_score: Optional[float] = None,
+    ) -> List[List[Tuple[float, Dict[str, str]]]]:
         index = self._ensure_index_loaded(index_name)
-        results = [
-            (score, {"chunk_id": record.chunk_id, "doc_id": record.doc_id, "text": record.text})
-            for score, record in index.query(text, top_k=top_k)
-        ]
-        if min_score is not None:
-            results = [item for item in results if item[0] >= min_score]
-        return results
+        batches: List[List[Tuple[float, Dict[str, str]]]] = []
+        for matches in index.query_many(texts, top_k=top_k):
+            results = [
+                (
+                    float(score),
+                    {"chunk_id": record.chunk_id, "doc_id": record.doc_id, "text": record.text},
+                )
+                for score, record in matches
+            ]
+            if min_score is not None:
+                results = [item for item in results if item[0] >= min_score]
+            batches.append(results)
+        return batches
 
     # ------------------------------------------------------------------
+    def _status_from_manifest(self, name: str) -> IndexStatus:
+        manifest = self._manifests[name]
+        if "chunks_count" not in manifest:
+            # Manifests written before counts were recorded need a full load.
+            return self._ensure_index_loaded(name).status()
+        chunk_config = manifest.get("chunk_config", {})
+        policy_obj = self._resolve_policy(
+            str(manifest["policy"]),
+            window_chars=chunk_config.get("window_chars"),
+            overlap_chars=chunk_config.get("overlap_chars"),
+        )
+        return IndexStatus(
+            name=name,
+            model=str(manifest["model"]),
+            policy=policy_obj.name,
+            documents=int(manifest["documents_count"]),
+            chunks=int(manifest["chunks_count"]),
+        )
+
     def list_indexes(self) -> List[IndexStatus]:
         statuses: List[IndexStatus] = []
         if not self._manifests:
             return statuses
         for name in sorted(self._manifests):
-            index = self._ensure_index_loaded(name)
-            statuses.append(index.status())
+            statuses.append(self._status_from_manifest(name))
         return statuses
 
     def reset_index(self, name: str) -> None:
+        self._loaded.pop(name, None)
         self.index_manager.reset(name)
         self._delete_manifest(name)
 
@@ -1,38 +1,39 @@
 """Chunking policies for different indexing strategies."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
 from typing import Iterable, List, Sequence
 
 
+# Blank lines (optionally holding other whitespace) separate paragraphs. The
+# pattern starts at a newline so long runs of spaces cannot backtrack.
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+
 def _tokenize(text: str) -> List[str]:
     return [token for token in text.split() if token]
 
 
-@dataclass
 class ChunkingPolicy:
     """Base class for chunking policies."""
 
-    name: str
+    def __init__(self, name: str) -> None:
+        self.name = name
 
     def chunk(self, text: str) -> List[str]:  # pragma: no cover - interface
         raise NotImplementedError
 
 
-@dataclass
 class SlidingWindowChunker(ChunkingPolicy):
     DEFAULT_WINDOW_CHARS = 800
     DEFAULT_OVERLAP_CHARS = 200
 
-    window_chars: int = DEFAULT_WINDOW_CHARS
-    overlap_chars: int = DEFAULT_OVERLAP_CHARS
-
     def __init__(
         self,
         window_chars: int = DEFAULT_WINDOW_CHARS,
         overlap_chars: int = DEFAULT_OVERLAP_CHARS,
     ) -> None:
-        super().__init__(name="sliding_window")
+        super().__init__("sliding_window")
         if window_chars <= 0:
             raise ValueError("window_chars must be positive")
         if overlap_chars < 0:
@@ -47,27 +48,32 @@ class SlidingWindowChunker(ChunkingPolicy):
         if not content:
             return []
         chunks: List[str] = []
+        length = len(content)
         step = self.window_chars - self.overlap_chars
-        for start in range(0, len(content), step):
-            window = content[start : start + self.window_chars].strip()
-            if window:
-                chunks.append(window)
+        for start in range(0, length, step):
+            end = min(start + self.window_chars, length)
+            window = content[start:end]
+            # Only windows that begin or end on whitespace need trimming.
+            if content[start].isspace() or content[end - 1].isspace():
+                window = window.strip()
+                if not window:
+                    continue
+            chunks.append(window)
         return chunks
 
 
-@dataclass
 class ParagraphChunker(ChunkingPolicy):
     def __init__(self) -> None:
-        super().__init__(name="paragraph")
+        super().__init__("paragraph")
 
     def chunk(self, text: str) -> List[str]:
-        return [para.strip() for para in text.split("\n\n") if para.strip()]
+        paragraphs = (para.strip() for para in _PARAGRAPH_BREAK_RE.split(text))
+        return [para for para in paragraphs if para]
 
 
-@dataclass
 class WholeDocumentChunker(ChunkingPolicy):
     def __init__(self) -> None:
-        super().__init__(name="whole_document")
+        super().__init__("whole_document")
 
     def chunk(self, text: str) -> List[str]:
         cleaned = text.strip()
@@ -1,30 +1,159 @@
 """Corpus management utilities."""
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from pypdf import PdfReader
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - optional dependency
+    pymupdf = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Below this many pages, process-pool startup costs more than it saves.
+_PARALLEL_PDF_MIN_PAGES = 4
+# Shared page-extraction pool, created on first use.
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _json_dumps(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Dict[str, object]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def _html_to_text(value: str) -> str:
-    """Naive HTML-to-text conversion by stripping tags."""
-    return _HTML_TAG_RE.sub(" ", value)
+    """HTML-to-text via selectolax, falling back to naive tag stripping."""
+    if LexborHTMLParser is None:
+        return _HTML_TAG_RE.sub(" ", value)
+    tree = LexborHTMLParser(value)
+    tree.strip_tags(["script", "style"])
+    # Keep text-node whitespace so paragraph breaks survive for the chunkers.
+    return tree.text(separator=" ") or ""
+
+
+def _extract_pdf_pages(job: Tuple[str, int, int]) -> List[str]:
+    path_str, start, stop = job
+    reader = PdfReader(path_str)
+    return [reader.pages[number].extract_text() or "" for number in range(start, stop)]
 
 
 def _pdf_to_text(path: Path) -> str:
+    if pymupdf is not None:
+        with pymupdf.open(str(path)) as document:
+            return "\n".join(page.get_text() for page in document)
+    return _pdf_to_text_pypdf(path)
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # Never fork() the (multi-threaded) web server; start workers from
+            # a clean forkserver/spawn process instead.
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return _pdf_pool
+
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _pdf_to_text_pypdf(path: Path) -> str:
     reader = PdfReader(str(path))
-    parts: List[str] = []
-    for page in reader.pages:
-        parts.append(page.extract_text() or "")
+    page_count = len(reader.pages)
+    if page_count < _PARALLEL_PDF_MIN_PAGES:
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    # Each worker opens the PDF once and extracts a contiguous page range.
+    workers = min(os.cpu_count() or 1, page_count)
+    step = -(-page_count // workers)
+    jobs = [
+        (str(path), start, min(start + step, page_count))
+        for start in range(0, page_count, step)
+    ]
+    pool = _get_pdf_pool()
+    try:
+        parts = [text for pages in pool.map(_extract_pdf_pages, jobs) for text in pages]
+    except BrokenProcessPool:
+        # Drop the dead pool so the next PDF gets a fresh one; finish this one here.
+        _discard_pdf_pool(pool)
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
     return "\n".join(parts)
 
 
+def _pdf_to_text_cached(path: Path, cache_dir: Path, mtime_ns: int, size: int) -> str:
+    """Extract PDF text, reusing a persisted copy made from this exact file version.
+
+    The PDF's mtime and size are part of the cache file name, so a replaced
+    PDF misses even when its timestamp moved backwards.
+    """
+    digest = hashlib.blake2b(str(path).encode("utf-8"), digest_size=16).hexdigest()
+    cached = cache_dir / f"{digest}-{mtime_ns}-{size}.txt"
+    try:
+        return cached.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
+    text = _pdf_to_text(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{digest}*.txt"):
+        stale.unlink(missing_ok=True)
+    partial = cached.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    partial.write_text(text, encoding="utf-8")
+    partial.replace(cached)
+    return text
+
+
+@functools.lru_cache(maxsize=256)
+def _load_cached(path_str: str, kind: str, mtime_ns: int, size: int, cache_dir: str) -> str:
+    """Parse a document; keyed on mtime/size so edited files are re-read."""
+    path = Path(path_str)
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        return _pdf_to_text_cached(path, Path(cache_dir), mtime_ns, size)
+    text = path.read_text(errors="ignore")
+    if kind == "html" or suffix in {".html", ".htm"}:
+        return _html_to_text(text)
+    return text
+
+
 @dataclass
 class DocumentRecord:
     """Metadata describing a registered document."""
@@ -53,8 +182,11 @@ class CorpusManager:
         self.root.mkdir(parents=True, exist_ok=True)
         self.download_dir = self.root / "downloads"
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.text_cache_dir = self.root / "text_cache"
         self.registry_path = self.root / "corpus.json"
         self._documents: Dict[str, DocumentRecord] = {}
+        # Registrations may arrive from several threads (web UX, fetch workers).
+        self._lock = threading.Lock()
         self._load()
 
     # ------------------------------------------------------------------
@@ -62,7 +194,7 @@ class CorpusManager:
     def _load(self) -> None:
         if not self.registry_path.exists():
             return
-        data = json.loads(self.registry_path.read_text())
+        data = _json_loads(self.registry_path.read_bytes())
         for doc in data.get("documents", []):
             record = DocumentRecord.from_dict(doc)
             self._documents[record.doc_id] = record
@@ -71,7 +203,7 @@ class CorpusManager:
         payload = {
             "documents": [doc.to_dict() for doc in self._documents.values()]
         }
-        self.registry_path.write_text(json.dumps(payload, indent=2))
+        self.registry_path.write_bytes(_json_dumps(payload))
 
     # ------------------------------------------------------------------
     def register_local_file(
@@ -84,7 +216,37 @@ class CorpusManager:
         description: Optional[str] = None,
     ) -> DocumentRecord:
         """Register a local file that belongs to the corpus."""
-        record = DocumentRecord(
+        record = self._local_record(doc_id, path, kind, tags, description)
+        with self._lock:
+            self._documents[doc_id] = record
+            self._save()
+        return record
+
+    def register_local_files(
+        self, entries: Iterable[Tuple[str, Path, str, Optional[str]]]
+    ) -> List[DocumentRecord]:
+        """Register ``(doc_id, path, kind, description)`` entries with one registry write."""
+        records = [
+            self._local_record(doc_id, path, kind, None, description)
+            for doc_id, path, kind, description in entries
+        ]
+        if not records:
+            return records
+        with self._lock:
+            for record in records:
+                self._documents[record.doc_id] = record
+            self._save()
+        return records
+
+    @staticmethod
+    def _local_record(
+        doc_id: str,
+        path: Path,
+        kind: str,
+        tags: Optional[Iterable[str]],
+        description: Optional[str],
+    ) -> DocumentRecord:
+        return DocumentRecord(
             doc_id=doc_id,
             source="file",
             kind=kind,
@@ -92,9 +254,6 @@ class CorpusManager:
             tags=list(tags or []),
             description=description,
         )
-        self._documents[doc_id] = record
-        self._save()
-        return record
 
     def register_url(
         self,
@@ -116,8 +275,9 @@ class CorpusManager:
             tags=list(tags or []),
             description=description,
         )
-        self._documents[doc_id] = record
-        self._save()
+        with self._lock:
+            self._documents[doc_id] = record
+            self._save()
         return record
 
     # ------------------------------------------------------------------
@@ -138,13 +298,14 @@ class CorpusManager:
                 f"Document {doc_id} does not have a local copy yet"
             )
         path = Path(record.path)
-        suffix = path.suffix.lower()
-        if suffix == ".pdf":
-            return _pdf_to_text(path)
-        text = path.read_text(errors="ignore")
-        if record.kind == "html" or suffix in {".html", ".htm"}:
-            return _html_to_text(text)
-        return text
+        stat = path.stat()
+        return _load_cached(
+            str(path),
+            record.kind,
+            stat.st_mtime_ns,
+            stat.st_size,
+            str(self.text_cache_dir),
+        )
 
     # ------------------------------------------------------------------
     def as_dict(self) -> Dict[str, object]:
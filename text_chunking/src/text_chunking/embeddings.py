@@ -1,12 +1,13 @@
 """Embedding backends."""
 from __future__ import annotations
 
-import hashlib
-import math
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Iterable, List
 
+import mmh3
+import numpy as np
+
 
 @dataclass
 class EmbeddingModel:
@@ -18,9 +19,17 @@ class EmbeddingModel:
     def dimensions(self) -> int:  # pragma: no cover - interface
         raise NotImplementedError
 
-    def embed_text(self, text: str) -> List[float]:  # pragma: no cover - interface
+    def embed_text(self, text: str) -> np.ndarray:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed many texts at once, returning an (N, dimensions) float32 matrix."""
+        if not texts:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+        return np.stack([self.embed_text(text) for text in texts]).astype(
+            np.float32, copy=False
+        )
+
 
 class HashedEmbeddingModel(EmbeddingModel):
     """Deterministic hashing-based embedding (fallback for tables/images)."""
@@ -33,35 +42,62 @@ class HashedEmbeddingModel(EmbeddingModel):
     def dimensions(self) -> int:
         return self._dimensions
 
-    def _vector_from_tokens(self, tokens: Iterable[str]) -> List[float]:
-        vector = [0.0] * self.dimensions
-        for token in tokens:
-            digest = hashlib.sha256(f"{self.name}:{token}".encode("utf-8")).digest()
-            bucket = int.from_bytes(digest[:4], "big") % self.dimensions
-            vector[bucket] += 1.0
-        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
-        return [value / norm for value in vector]
-
-    def embed_text(self, text: str) -> List[float]:
-        tokens = [token.lower() for token in text.split() if token]
-        return self._vector_from_tokens(tokens)
+    def _tokenize(self, text: str) -> List[str]:
+        return [token.lower() for token in text.split() if token]
+
+    def _buckets(self, tokens: Iterable[str]) -> np.ndarray:
+        return np.fromiter(
+            (
+                mmh3.hash(f"{self.name}:{token}", signed=False) % self.dimensions
+                for token in tokens
+            ),
+            dtype=np.int64,
+        )
+
+    def _vector_from_tokens(self, tokens: Iterable[str]) -> np.ndarray:
+        vector = np.bincount(
+            self._buckets(tokens), minlength=self.dimensions
+        ).astype(np.float32)
+        vector /= np.linalg.norm(vector) or 1.0
+        return vector
+
+    def embed_text(self, text: str) -> np.ndarray:
+        return self._vector_from_tokens(self._tokenize(text))
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        token_lists = [self._tokenize(text) for text in texts]
+        # Offset every text's buckets into its own row so one bincount over
+        # the flattened tokens yields the whole (N, dimensions) count matrix.
+        rows = np.repeat(
+            np.arange(len(texts), dtype=np.int64),
+            [len(tokens) for tokens in token_lists],
+        )
+        buckets = self._buckets(token for tokens in token_lists for token in tokens)
+        counts = np.bincount(
+            rows * self.dimensions + buckets,
+            minlength=len(texts) * self.dimensions,
+        )
+        matrix = counts.reshape(len(texts), self.dimensions).astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
 
 
 class TableEmbeddingModel(HashedEmbeddingModel):
     def __init__(self, dimensions: int = 128) -> None:
         super().__init__("table", dimensions=dimensions)
 
-    def embed_text(self, text: str) -> List[float]:
+    def _tokenize(self, text: str) -> List[str]:
         cells = [cell.strip().lower() for cell in text.replace("\t", "|").split("|")]
-        return self._vector_from_tokens(cell for cell in cells if cell)
+        return [cell for cell in cells if cell]
 
 
 class ImageEmbeddingModel(HashedEmbeddingModel):
     def __init__(self, dimensions: int = 128) -> None:
         super().__init__("image", dimensions=dimensions)
 
-    def embed_text(self, text: str) -> List[float]:
-        return super().embed_text(f"image {text}")
+    def _tokenize(self, text: str) -> List[str]:
+        return super()._tokenize(f"image {text}")
 
 
 class SentenceTransformerEmbeddingModel(EmbeddingModel):
@@ -83,10 +119,22 @@ class SentenceTransformerEmbeddingModel(EmbeddingModel):
         self._ensure_model()
         return int(self._model.get_sentence_embedding_dimension())
 
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         self._ensure_model()
         vector = self._model.encode(text, normalize_embeddings=True)
-        return vector.tolist()
+        return vector.astype(np.float32, copy=False)
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        self._ensure_model()
+        if not texts:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+        vectors = self._model.encode(
+            texts,
+            batch_size=64,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+        return vectors.astype(np.float32, copy=False)
 
 
 __all__ = [
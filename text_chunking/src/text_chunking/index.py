@@ -1,15 +1,25 @@
 """Vector database built on HNSW."""
 from __future__ import annotations
 
+import hashlib
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Tuple
 
 import hnswlib
 import numpy as np
 
 from .chunking import ChunkingPolicy
+from .corpus import _json_dumps, _json_loads
 from .embeddings import EmbeddingModel
 
+# Upper bounds (in characters) of the length buckets used when batching
+# chunks for the embedding model; anything longer lands in a final bucket.
+_LENGTH_BUCKETS = (128, 256, 512)
+
 
 @dataclass
 class ChunkRecord:
@@ -40,12 +50,23 @@ class VectorIndex:
         self._hnsw: hnswlib.Index | None = None
         self._max_elements = 2048
         self._next_label = 0
+        # Query embeddings keyed by a digest of the text; the model is fixed
+        # per index so it does not need to be part of the key.
+        self._qcache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._qcache_max = 1024
+        # Queries run concurrently from the web server's worker threads.
+        self._qcache_lock = threading.Lock()
 
     # ------------------------------------------------------------------
-    def _ensure_index(self) -> None:
+    def _ensure_index(self, expected: int = 0) -> None:
         if self._hnsw is not None:
             return
-        self._hnsw = hnswlib.Index(space="cosine", dim=self.model.dimensions)
+        # Size the graph for the first batch up front; resize_index rebuilds
+        # internal structures, so avoid the doubling path when N is known.
+        self._max_elements = max(self._max_elements, self._next_label + expected)
+        # Embedding models emit unit vectors, so inner product equals cosine
+        # similarity without hnswlib re-normalizing every vector.
+        self._hnsw = hnswlib.Index(space="ip", dim=self.model.dimensions)
         self._hnsw.init_index(
             max_elements=self._max_elements,
             ef_construction=200,
@@ -66,38 +87,131 @@ class VectorIndex:
     # ------------------------------------------------------------------
     def add_document(self, doc_id: str, text: str, *, metadata: Dict[str, str]) -> None:
         chunks = self.policy.chunk(text)
-        vectors: List[np.ndarray] = []
-        labels: List[int] = []
-        for index, chunk_text in enumerate(chunks):
-            chunk_id = f"{doc_id}:{index}"
-            self._records.append(
-                ChunkRecord(
-                    chunk_id=chunk_id,
-                    doc_id=doc_id,
-                    text=chunk_text,
-                    metadata={"order": str(index), **metadata},
-                )
+        self.add_many(
+            [(doc_id, index, chunk_text) for index, chunk_text in enumerate(chunks)],
+            metadata=metadata,
+        )
+
+    def add_many(
+        self, entries: List[Tuple[str, int, str]], *, metadata: Dict[str, str]
+    ) -> None:
+        """Insert pre-chunked ``(doc_id, order, text)`` entries in one pass.
+
+        Chunks are embedded in length-sorted buckets so every encoder batch
+        pads to a similar length; each bucket is written straight into its
+        entry rows of one contiguous matrix so labels line up with
+        ``_records`` without an extra stacking copy.
+        """
+        if not entries:
+            return
+        order = sorted(range(len(entries)), key=lambda position: len(entries[position][2]))
+        vectors = np.empty((len(entries), self.model.dimensions), dtype=np.float32)
+        for bucket in _length_buckets(entries, order):
+            vectors[bucket] = self.model.embed_batch(
+                [entries[position][2] for position in bucket]
+            )
+        assert _is_normalized(vectors), f"{self.model.name} returned non-unit embeddings"
+        start = self._next_label
+        self._ensure_index(expected=len(entries))
+        self._grow_if_needed(len(entries))
+        self._hnsw.add_items(vectors, list(range(start, start + len(entries))))
+        self._records.extend(
+            ChunkRecord(
+                chunk_id=f"{doc_id}:{index}",
+                doc_id=doc_id,
+                text=chunk_text,
+                metadata={"order": str(index), **metadata},
             )
-            embedding = np.array(self.model.embed_text(chunk_text), dtype=np.float32)
-            vectors.append(embedding)
-            labels.append(self._next_label)
-            self._next_label += 1
-        if vectors:
-            self._ensure_index()
-            self._grow_if_needed(len(vectors))
-            self._hnsw.add_items(np.vstack(vectors), labels)
-            self._document_ids.add(doc_id)
+            for doc_id, index, chunk_text in entries
+        )
+        self._next_label += len(entries)
+        self._document_ids.update(doc_id for doc_id, _, _ in entries)
+
+    def _query_vectors(self, texts: List[str]) -> np.ndarray:
+        """Embed queries, serving repeats from the LRU and batching the rest."""
+        keys = [hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest() for text in texts]
+        vectors = np.empty((len(texts), self.model.dimensions), dtype=np.float32)
+        misses: List[int] = []
+        with self._qcache_lock:
+            for row, key in enumerate(keys):
+                cached = self._qcache.get(key)
+                if cached is None:
+                    misses.append(row)
+                else:
+                    self._qcache.move_to_end(key)
+                    vectors[row] = cached
+        if misses:
+            # Embed outside the lock; a concurrent miss on the same text just
+            # stores an identical vector.
+            vectors[misses] = self.model.embed_batch([texts[row] for row in misses])
+            with self._qcache_lock:
+                for row in misses:
+                    self._qcache[keys[row]] = vectors[row].copy()
+                while len(self._qcache) > self._qcache_max:
+                    self._qcache.popitem(last=False)
+        return vectors
 
     def query(self, text: str, top_k: int = 5) -> List[Tuple[float, ChunkRecord]]:
-        if not self._hnsw or self._next_label == 0:
-            return []
-        vector = np.array(self.model.embed_text(text), dtype=np.float32).reshape(1, -1)
-        labels, distances = self._hnsw.knn_query(vector, k=min(top_k, self._next_label))
-        results: List[Tuple[float, ChunkRecord]] = []
-        for label, dist in zip(labels[0], distances[0]):
-            if label < len(self._records):
-                results.append((1.0 - dist, self._records[label]))
-        return results
+        return self.query_many([text], top_k=top_k)[0]
+
+    def query_many(
+        self, texts: List[str], top_k: int = 5
+    ) -> List[List[Tuple[float, ChunkRecord]]]:
+        """Answer several queries with one embedding batch and one knn_query."""
+        if not self._hnsw or self._next_label == 0 or not texts:
+            return [[] for _ in texts]
+        vectors = self._query_vectors(texts)
+        labels, distances = self._hnsw.knn_query(
+            vectors, k=min(top_k, self._next_label), num_threads=-1
+        )
+        return [
+            [
+                (1.0 - dist, self._records[label])
+                for label, dist in zip(row_labels, row_distances)
+                if label < len(self._records)
+            ]
+            for row_labels, row_distances in zip(labels, distances)
+        ]
+
+    # ------------------------------------------------------------------
+    def save(self, hnsw_path: Path, records_path: Path) -> None:
+        """Persist the HNSW graph plus chunk records so reloads skip embedding."""
+        if self._hnsw is not None:
+            self._hnsw.save_index(str(hnsw_path))
+        payload = {
+            "records": [
+                {
+                    "chunk_id": record.chunk_id,
+                    "doc_id": record.doc_id,
+                    "text": record.text,
+                    "metadata": record.metadata,
+                }
+                for record in self._records
+            ]
+        }
+        Path(records_path).write_bytes(_json_dumps(payload))
+
+    def load(self, hnsw_path: Path, records_path: Path) -> None:
+        """Restore state written by :meth:`save`."""
+        data = _json_loads(Path(records_path).read_bytes())
+        self._records = [
+            ChunkRecord(
+                chunk_id=record["chunk_id"],
+                doc_id=record["doc_id"],
+                text=record["text"],
+                metadata=record["metadata"],
+            )
+            for record in data["records"]
+        ]
+        self._document_ids = {record.doc_id for record in self._records}
+        self._next_label = len(self._records)
+        self._hnsw = None
+        if not self._records:
+            return
+        self._max_elements = max(self._max_elements, self._next_label)
+        self._hnsw = hnswlib.Index(space="ip", dim=self.model.dimensions)
+        self._hnsw.load_index(str(hnsw_path), max_elements=self._max_elements)
+        self._hnsw.set_ef(64)
 
     def status(self) -> IndexStatus:
         return IndexStatus(
@@ -109,6 +223,22 @@ class VectorIndex:
         )
 
 
+def _is_normalized(vectors: np.ndarray) -> bool:
+    """True when every row is unit length (all-zero rows are tolerated)."""
+    norms = np.linalg.norm(vectors, axis=1)
+    return bool((np.isclose(norms, 1.0, atol=1e-5) | (norms == 0)).all())
+
+
+def _length_buckets(
+    entries: List[Tuple[str, int, str]], order: List[int]
+) -> List[List[int]]:
+    """Partition length-sorted entry positions into ``_LENGTH_BUCKETS``."""
+    buckets: List[List[int]] = [[] for _ in range(len(_LENGTH_BUCKETS) + 1)]
+    for position in order:
+        buckets[bisect_left(_LENGTH_BUCKETS, len(entries[position][2]))].append(position)
+    return [bucket for bucket in buckets if bucket]
+
+
 class IndexManager:
     """Tracks multiple indexes (per model × chunking strategy)."""
 
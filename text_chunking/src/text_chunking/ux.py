@@ -14,10 +14,10 @@ def render_documents(documents: Iterable[DocumentRecord]) -> str:
         lines.append("  (empty)")
     else:
         for doc in docs:
-            summary = f"- {doc.doc_id}: {doc.kind} ({doc.source})"
+            parts = [f"- {doc.doc_id}: {doc.kind} ({doc.source})"]
             if doc.description:
-                summary += f" — {doc.description}"
-            lines.append(summary)
+                parts.append(f" — {doc.description}")
+            lines.append("".join(parts))
     return "\n".join(lines)
 
 
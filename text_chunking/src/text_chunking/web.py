@@ -1,18 +1,269 @@
 """Minimal web UX for exploring indexes."""
 from __future__ import annotations
 
+import functools
+import hashlib
 import html
+import os
+import queue
+import socket
+import tempfile
+import threading
 import urllib.parse
 import urllib.request
+from collections import deque
 from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from email.parser import BytesParser
+from email.parser import BytesHeaderParser
 from email.policy import default as email_policy
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple
 
 from .api import IndexingService
+from .corpus import DocumentRecord
+
+
+# Everything around the per-request nav/message/body, encoded once at import.
+_STATIC_HEAD = """
+    <!doctype html>
+    <html lang="en">
+    <head>
+      <meta charset="utf-8" />
+      <title>Text Chunking Playground</title>
+      <style>
+        body { font-family: sans-serif; margin: 2rem; max-width: 960px; }
+        section { margin-bottom: 2rem; }
+        textarea { width: 100%; min-height: 140px; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 0.5rem; text-align: left; }
+        th { background: #f0f0f0; }
+        .flash { padding: 0.75rem; background: #eef; border: 1px solid #aac; margin-bottom: 1rem; }
+        .forms { display: grid; gap: 1.5rem; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); }
+        form { border: 1px solid #ddd; padding: 1rem; border-radius: 6px; background: #fafafa; }
+        label { display: block; font-weight: 600; margin-top: 0.5rem; }
+        input[type=text], select { width: 100%; padding: 0.4rem; }
+        button { margin-top: 0.75rem; padding: 0.5rem 0.75rem; }
+        nav { margin-bottom: 1.5rem; }
+        nav a { margin-right: 1rem; text-decoration: none; font-weight: 600; color: #555; }
+        nav a.active { color: #000; text-decoration: underline; }
+        .note { font-size: 0.85rem; color: #555; margin: 0.2rem 0 0.6rem; }
+        .search-form { display: flex; flex-wrap: wrap; gap: 0.5rem; align-items: center; margin: 0 0 0.5rem; }
+        .search-form input { flex: 1; min-width: 200px; padding: 0.4rem; }
+        .search-form label { margin: 0; }
+        .search-form .clear { font-size: 0.85rem; color: #0070f3; text-decoration: none; }
+        .corpus-meta { font-size: 0.9rem; color: #555; margin-bottom: 0.5rem; }
+      </style>
+    </head>
+    <body>
+      <h1>Text Chunking Playground</h1>
+      """.encode("utf-8")
+
+_STATIC_TAIL = """
+    </body>
+    <script>
+      document.addEventListener('DOMContentLoaded', function() {
+        const picker = document.getElementById('picker');
+        const manual = document.getElementById('manual_path');
+        if (picker && manual) {
+          picker.addEventListener('change', () => {
+            if (!picker.files || picker.files.length === 0) {
+              return;
+            }
+            const first = picker.files[0];
+            if (first.webkitRelativePath) {
+              manual.value = '';
+              return;
+            }
+            manual.value = first.name;
+          });
+        }
+      });
+    </script>
+    </html>
+    """.encode("utf-8")
+
+_NAV_CORPUS = """
+    <nav>
+      <a href="/corpus" class="active">Corpus</a>
+      <a href="/indexes" class="">Indexes</a>
+    </nav>
+    """.encode("utf-8")
+
+_NAV_INDEXES = """
+    <nav>
+      <a href="/corpus" class="">Corpus</a>
+      <a href="/indexes" class="active">Indexes</a>
+    </nav>
+    """.encode("utf-8")
+
+# Whitespace between the nav, message and body slots.
+_GAP = b"\n      "
+
+# Revisions restart at zero with the process; this keeps old ETags from matching.
+_ETAG_TOKEN = os.urandom(4).hex()
+
+
+def _sorted_entries(directory: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(entries, key=lambda entry: entry.name, reverse=True)
+    except PermissionError:
+        return []
+
+
+def _iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield files below ``root`` in sorted path order.
+
+    An iterative pre-order DFS over ``os.scandir`` with each directory sorted
+    by name, which matches ``sorted(root.rglob("*"))`` without materialising
+    the whole tree. Directory checks reuse the dirent type, so directories
+    cost no extra ``stat``; directory symlinks are not followed. Entries are
+    yielded as-is so callers can use the dirent name without re-parsing.
+    """
+    # Entries are pushed in reverse name order so pops come out ascending.
+    stack: Deque[os.DirEntry] = deque(_sorted_entries(str(root)))
+    while stack:
+        entry = stack.pop()
+        if entry.is_dir(follow_symlinks=False):
+            stack.extend(_sorted_entries(entry.path))
+        elif entry.is_file():
+            yield entry
+
+
+_STREAM_CHUNK_BYTES = 64 * 1024
+# How many of the latest documents the unsearched corpus page lists.
+RECENT_LIMIT = 10
+
+# Lower bound for the pooled HTTP server's worker count.
+_MIN_HTTP_WORKERS = 32
+
+# Background URL downloads: worker count, per-socket-operation timeout, size cap.
+_FETCH_WORKERS = 4
+_FETCH_TIMEOUT_SECONDS = 30
+_MAX_DOWNLOAD_BYTES = 256 * 1024 * 1024
+
+# File extensions per document kind, matched with str.endswith on the lowered name.
+_TEXT_EXTS = (".txt", ".md", ".rtf")
+_TABLE_EXTS = (".csv", ".tsv", ".xls", ".xlsx")
+_HTML_EXTS = (".html", ".htm")
+_PDF_EXTS = (".pdf",)
+_IMAGE_EXTS = (".jpg", ".jpeg", ".png")
+
+
+def _parse_headers(blob: bytes):
+    return BytesHeaderParser(policy=email_policy).parsebytes(blob)
+
+
+def _parse_multipart_stream(
+    rfile: BinaryIO, boundary: str, length: int, spool_dir: Path
+) -> Tuple[Dict[str, str], Dict[str, List[Tuple[str, Path]]]]:
+    """Parse a multipart/form-data body straight off the socket.
+
+    The body is read in fixed-size chunks. File parts are written to
+    temporary files in ``spool_dir`` as they arrive (returned as
+    ``(filename, path)`` pairs); only plain fields are held in memory.
+    """
+    remaining = length
+
+    def read_chunk() -> bytes:
+        nonlocal remaining
+        if remaining <= 0:
+            return b""
+        chunk = rfile.read(min(_STREAM_CHUNK_BYTES, remaining))
+        remaining = remaining - len(chunk) if chunk else 0
+        return chunk
+
+    def fill(buffer: bytes) -> bytes:
+        chunk = read_chunk()
+        if not chunk:
+            raise ValueError("Malformed multipart body")
+        return buffer + chunk
+
+    delimiter = b"--" + boundary.encode("latin-1")
+    separator = b"\r\n" + delimiter
+    keep = len(separator) - 1
+    fields: Dict[str, str] = {}
+    files: Dict[str, List[Tuple[str, Path]]] = {}
+    buffer = b""
+    spool = None
+    try:
+        # Skip the preamble up to the first delimiter.
+        while (start := buffer.find(delimiter)) < 0:
+            buffer = fill(buffer[-keep:])
+        buffer = buffer[start + len(delimiter) :]
+        while True:
+            while len(buffer) < 2:
+                buffer = fill(buffer)
+            if buffer.startswith(b"--"):
+                break
+            while (end := buffer.find(b"\r\n\r\n")) < 0:
+                buffer = fill(buffer)
+            headers = _parse_headers(buffer[2:end] if end >= 2 else b"")
+            buffer = buffer[end + 4 :]
+            name = headers.get_param("name", header="content-disposition")
+            filename = headers.get_filename()
+            spool = None
+            field: Optional[bytearray] = None
+            if headers.get_content_disposition() != "form-data" or not name:
+                pass
+            elif filename:
+                spool = tempfile.NamedTemporaryFile(
+                    "wb", dir=spool_dir, prefix=".upload-", suffix=".part", delete=False
+                )
+                files.setdefault(name, []).append((filename, Path(spool.name)))
+            else:
+                field = bytearray()
+            # Stream the part body, holding back enough bytes to spot a
+            # separator that straddles two reads.
+            while (end := buffer.find(separator)) < 0:
+                if len(buffer) > keep:
+                    if spool is not None:
+                        spool.write(buffer[:-keep])
+                    elif field is not None:
+                        field.extend(buffer[:-keep])
+                    buffer = buffer[-keep:]
+                buffer = fill(buffer)
+            if spool is not None:
+                spool.write(buffer[:end])
+                spool.close()
+                spool = None
+            elif field is not None:
+                field.extend(buffer[:end])
+                charset = headers.get_content_charset() or "utf-8"
+                fields[name] = field.decode(charset)
+            buffer = buffer[end + len(separator) :]
+    except BaseException:
+        if spool is not None:
+            spool.close()
+        _discard_uploads(files)
+        raise
+    # Drain any epilogue so the connection stays in sync.
+    while read_chunk():
+        pass
+    return fields, files
+
+
+def _discard_uploads(files: Dict[str, List[Tuple[str, Path]]]) -> None:
+    """Remove spooled upload files that were not moved into the corpus."""
+    for uploads in files.values():
+        for _, spooled in uploads:
+            spooled.unlink(missing_ok=True)
+
+
+def _esc(text: str) -> str:
+    """``html.escape`` for the listing loops, returning clean strings untouched.
+
+    Ids, paths and descriptions rarely contain markup characters, and these
+    membership tests are cheaper than escape's unconditional replace passes.
+    """
+    if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+        return html.escape(text)
+    return text
+
+
+def _search_key(record: DocumentRecord) -> Tuple[str, str, DocumentRecord]:
+    return record.doc_id.casefold(), (record.description or "").casefold(), record
 
 
 @dataclass
@@ -36,57 +287,94 @@ class UXApplication:
         if legacy_dir.exists() and not self.inline_dir.exists():
             legacy_dir.rename(self.inline_dir)
         self.inline_dir.mkdir(parents=True, exist_ok=True)
-        self._ext_to_kind = {
-            ".txt": "text",
-            ".md": "text",
-            ".rtf": "text",
-            ".csv": "table",
-            ".tsv": "table",
-            ".xls": "table",
-            ".xlsx": "table",
-            ".html": "html",
-            ".htm": "html",
-            ".pdf": "pdf",
-            ".jpg": "image",
-            ".jpeg": "image",
-            ".png": "image",
+        # Bumped by every mutation; part of the rendered-page cache key.
+        self._corpus_rev = 0
+        self._index_rev = 0
+        # Escaped index table rows and <option> list, valid for one _index_rev.
+        self._cached_index_listing: Optional[Tuple[int, str, str]] = None
+        # Guards the in-memory UX state; URL fetch workers update it too.
+        self._state_lock = threading.Lock()
+        # Pending (doc_id, url, path) downloads; None tells a worker to exit.
+        self._fetch_queue: "queue.SimpleQueue[Optional[Tuple[str, str, Path]]]" = queue.SimpleQueue()
+        self._fetch_workers: List[threading.Thread] = []
+        docs = self.service.corpus.list_documents()
+        self._doc_ids = {doc.doc_id for doc in docs}
+        # Latest registrations, newest last; the unsearched corpus page shows these.
+        self._recent: Deque[DocumentRecord] = deque(docs[-RECENT_LIMIT:], maxlen=RECENT_LIMIT)
+        # doc_id -> (casefolded id, casefolded description, record) for search.
+        self._doc_search_index: Dict[str, Tuple[str, str, DocumentRecord]] = {
+            doc.doc_id: _search_key(doc) for doc in docs
         }
+        # Next suffix to try per normalized seed, so collisions do not rescan from 2.
+        self._doc_id_counters: Dict[str, int] = {}
 
     def _infer_kind(self, name: str | None) -> str:
         if not name:
             return "text"
-        ext = Path(name).suffix.lower()
-        return self._ext_to_kind.get(ext, "text")
+        lowered = name.lower()
+        if lowered.endswith(_TEXT_EXTS):
+            return "text"
+        if lowered.endswith(_TABLE_EXTS):
+            return "table"
+        if lowered.endswith(_HTML_EXTS):
+            return "html"
+        if lowered.endswith(_PDF_EXTS):
+            return "pdf"
+        if lowered.endswith(_IMAGE_EXTS):
+            return "image"
+        return "text"
 
     # ------------------------------------------------------------------
     def _generate_doc_id(self, seed: Optional[str] = None) -> str:
-        existing = {doc.doc_id for doc in self.service.corpus.list_documents()}
+        """Pick an unused doc id for ``seed`` and reserve it.
+
+        The id goes into ``_doc_ids`` straight away, under the state lock, so
+        concurrent requests (or later files in one folder walk) never receive
+        the same id before it has been registered.
+        """
         normalized = "".join(
             ch.lower() if ch.isalnum() else "-"
             for ch in (seed.strip() if seed else "doc")
         ).strip("-") or "doc"
-        candidate = normalized
-        suffix = 2
-        while candidate in existing:
-            candidate = f"{normalized}-{suffix}"
-            suffix += 1
+        with self._state_lock:
+            candidate = normalized
+            suffix = self._doc_id_counters.get(normalized, 2)
+            while candidate in self._doc_ids:
+                candidate = f"{normalized}-{suffix}"
+                suffix += 1
+            self._doc_id_counters[normalized] = suffix
+            self._doc_ids.add(candidate)
         return candidate
 
+    def _remember(self, record: DocumentRecord) -> None:
+        """Fold a newly registered document into the in-memory UX state."""
+        with self._state_lock:
+            if record.doc_id in self._doc_ids:
+                for existing in self._recent:
+                    if existing.doc_id == record.doc_id:
+                        self._recent.remove(existing)
+                        break
+            self._doc_ids.add(record.doc_id)
+            self._recent.append(record)
+            self._doc_search_index[record.doc_id] = _search_key(record)
+            self._corpus_rev += 1
+
     def create_document(self, content: str, doc_id: Optional[str] = None) -> str:
         if not content.strip():
             raise ValueError("Content is required")
         doc_id = doc_id.strip() if doc_id and doc_id.strip() else self._generate_doc_id()
         path = self.inline_dir / f"{doc_id}.txt"
         path.write_text(content.strip() + "\n")
-        self.service.register_local(
+        record = self.service.register_local(
             doc_id,
             path,
             kind="text",
             description="Added via web UX",
         )
+        self._remember(record)
         return doc_id
 
-    def register_file(self, file_path: str, doc_id: Optional[str] = None) -> str:
+    def register_file(self, file_path: str | Path, doc_id: Optional[str] = None) -> str:
         path = Path(file_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
@@ -97,6 +385,7 @@ class UXApplication:
             kind=self._infer_kind(path.name),
             description="Registered via web UX",
         )
+        self._remember(record)
         return record.doc_id
 
     def register_url(self, url: str, doc_id: Optional[str] = None) -> str:
@@ -108,49 +397,125 @@ class UXApplication:
         doc_id = doc_id.strip() if doc_id and doc_id.strip() else self._generate_doc_id(seed)
         suffix = Path(parsed.path).suffix or ".html"
         path = self.inline_dir / f"{doc_id}{suffix}"
-        with urllib.request.urlopen(url) as response:
-            data = response.read()
-        path.write_bytes(data)
-        self.service.register_url(
+        # Register an empty placeholder now; the fetch pool fills it in.
+        path.touch()
+        record = self.service.register_url(
             doc_id,
             url,
             local_copy=path,
             kind=self._infer_kind(path.name),
-            description="Downloaded via web UX",
+            description="Downloading...",
         )
+        self._remember(record)
+        self._start_fetch_workers()
+        self._fetch_queue.put((doc_id, url, path))
         return doc_id
 
-    def upload_file(self, filename: str, content: bytes) -> str:
+    def _start_fetch_workers(self) -> None:
+        # Daemon threads, so a fetch stuck on a slow server never blocks exit.
+        with self._state_lock:
+            while len(self._fetch_workers) < _FETCH_WORKERS:
+                worker = threading.Thread(
+                    target=self._fetch_worker,
+                    name=f"ux-fetch-{len(self._fetch_workers)}",
+                    daemon=True,
+                )
+                worker.start()
+                self._fetch_workers.append(worker)
+
+    def _fetch_worker(self) -> None:
+        while (job := self._fetch_queue.get()) is not None:
+            self._fetch_url(*job)
+
+    def _fetch_url(self, doc_id: str, url: str, path: Path) -> None:
+        partial = path.with_name(f".{path.name}.download")
+        try:
+            received = 0
+            with urllib.request.urlopen(url, timeout=_FETCH_TIMEOUT_SECONDS) as response:
+                with partial.open("wb") as handle:
+                    while chunk := response.read(_STREAM_CHUNK_BYTES):
+                        received += len(chunk)
+                        if received > _MAX_DOWNLOAD_BYTES:
+                            raise ValueError(
+                                f"response exceeds {_MAX_DOWNLOAD_BYTES // (1024 * 1024)} MiB"
+                            )
+                        handle.write(chunk)
+            partial.replace(path)
+            description = "Downloaded via web UX"
+        except Exception as exc:
+            partial.unlink(missing_ok=True)
+            description = f"Download failed: {exc}"
+        record = self.service.register_url(
+            doc_id,
+            url,
+            local_copy=path,
+            kind=self._infer_kind(path.name),
+            description=description,
+        )
+        self._remember(record)
+
+    def close(self) -> None:
+        """Stop the URL download workers; in-flight fetches are abandoned."""
+        with self._state_lock:
+            workers, self._fetch_workers = self._fetch_workers, []
+        for _ in workers:
+            self._fetch_queue.put(None)
+
+    def upload_file(self, filename: str, source: Path) -> str:
+        """Register an upload already spooled to ``source`` (moved into place)."""
         if not filename:
             raise ValueError("Filename is required")
         seed = Path(filename).stem or "upload"
         doc_id = self._generate_doc_id(seed)
         suffix = Path(filename).suffix or ".txt"
         path = self.inline_dir / f"{doc_id}{suffix}"
-        path.write_bytes(content)
-        self.service.register_local(
+        source.replace(path)
+        record = self.service.register_local(
             doc_id,
             path,
             kind=self._infer_kind(filename),
             description="Uploaded via web UX",
         )
+        self._remember(record)
         return doc_id
 
     def upload_folder(self, folder_path: str | Path) -> List[str]:
         folder = Path(folder_path).expanduser()
         if not folder.exists() or not folder.is_dir():
             raise FileNotFoundError(f"Folder not found: {folder}")
-        doc_ids: List[str] = []
-        for path in sorted(folder.rglob("*")):
-            if not path.is_file():
-                continue
-            doc_ids.append(self.register_file(path))
-        return doc_ids
+        entries: List[Tuple[str, Path, str, Optional[str]]] = []
+        try:
+            for entry in _iter_files(folder):
+                doc_id = self._generate_doc_id(os.path.splitext(entry.name)[0])
+                entries.append(
+                    (
+                        doc_id,
+                        Path(entry.path),
+                        self._infer_kind(entry.name),
+                        "Registered via web UX",
+                    )
+                )
+            records = self.service.register_local_bulk(entries)
+        except BaseException:
+            with self._state_lock:
+                self._doc_ids.difference_update(doc_id for doc_id, *_ in entries)
+            raise
+        for record in records:
+            self._remember(record)
+        return [record.doc_id for record in records]
 
     def reset_all_indexes(self) -> None:
         statuses = list(self.service.list_indexes())
-        for status in statuses:
-            self.service.reset_index(status.name)
+        try:
+            for status in statuses:
+                self.service.reset_index(status.name)
+        finally:
+            self._bump_index_rev()
+
+    def _bump_index_rev(self) -> None:
+        # Builds and resets run on concurrent workers; an unlocked += can be lost.
+        with self._state_lock:
+            self._index_rev += 1
 
     def build_index(
         self,
@@ -162,105 +527,90 @@ class UXApplication:
         window_chars: Optional[int] = None,
         overlap_chars: Optional[int] = None,
     ) -> str:
-        status = self.service.build_index(
-            model=model,
-            policy=policy,
-            documents=documents,
-            name=name,
-            window_chars=window_chars,
-            overlap_chars=overlap_chars,
-        )
+        try:
+            status = self.service.build_index(
+                model=model,
+                policy=policy,
+                documents=documents,
+                name=name,
+                window_chars=window_chars,
+                overlap_chars=overlap_chars,
+            )
+        finally:
+            self._bump_index_rev()
         return status.name
 
+    def index_listing(self) -> Tuple[str, str]:
+        """Return ``(index_rows, options_indexes)`` HTML for the current indexes."""
+        cached = self._cached_index_listing
+        if cached is not None and cached[0] == self._index_rev:
+            return cached[1], cached[2]
+        rev = self._index_rev
+        esc = _esc
+        option_parts: List[str] = []
+        row_parts: List[str] = []
+        for status in self.service.list_indexes():
+            name = esc(status.name)
+            option_parts.append(f'<option value="{name}" >{name}</option>')
+            row_parts.append(
+                f"<tr><td>{name}</td><td>{esc(status.model)}</td>"
+                f"<td>{esc(status.policy)}</td><td>{status.documents}</td>"
+                f"<td>{status.chunks}</td></tr>"
+            )
+        index_rows = "".join(row_parts)
+        options_indexes = "".join(option_parts)
+        self._cached_index_listing = (rev, index_rows, options_indexes)
+        return index_rows, options_indexes
+
+    def search_documents(self, query: str) -> List[DocumentRecord]:
+        """Documents whose id or description contains ``query`` (case-insensitive)."""
+        needle = query.casefold()
+        with self._state_lock:
+            matches = [
+                record
+                for id_cf, description_cf, record in self._doc_search_index.values()
+                if needle in id_cf or needle in description_cf
+            ]
+        matches.sort(key=lambda record: record.doc_id)
+        return matches
+
     def query(self, index: str, text: str, top_k: int = 5, min_score: Optional[float] = None):
         return self.service.query(index, text, top_k=top_k, min_score=min_score)
 
 
-def _render_page(app: UXApplication, context: UXContext | None = None) -> str:
-    context = context or UXContext()
-    view = context.view or "corpus"
-    docs = app.service.corpus.list_documents()
+def _render_corpus(app: UXApplication, context: UXContext) -> str:
+    total_docs = len(app.service.corpus)
     search_query = (context.search_query or "").strip()
     if search_query:
-        needle = search_query.lower()
-        filtered_docs = [
-            doc
-            for doc in docs
-            if needle in doc.doc_id.lower()
-            or (doc.description and needle in doc.description.lower())
-        ]
-    else:
-        filtered_docs = docs
-    RECENT_LIMIT = 10
-    if search_query:
-        display_docs = filtered_docs
+        display_docs = app.search_documents(search_query)
+        shown_count = len(display_docs)
     else:
-        display_docs = filtered_docs[-RECENT_LIMIT:]
-    display_docs = list(display_docs)
-    if not search_query:
-        display_docs = list(reversed(display_docs))
-    more_count = max(len(filtered_docs) - len(display_docs), 0)
-    indexes = app.service.list_indexes()
-    options_indexes = "".join(
-        f'<option value="{html.escape(status.name)}"'
-        f" {'selected' if status.name == context.query_index else ''}>{html.escape(status.name)}</option>"
-        for status in indexes
-    )
-    doc_items = "".join(
-        f"<li><strong>{html.escape(doc.doc_id)}</strong> — {html.escape(doc.kind)} ({html.escape(doc.source)})"
-        + (f" : {html.escape(doc.description)}" if doc.description else "")
-        + "</li>"
-        for doc in display_docs
-    )
-    index_rows = "".join(
-        "<tr>"
-        f"<td>{html.escape(status.name)}</td>"
-        f"<td>{html.escape(status.model)}</td>"
-        f"<td>{html.escape(status.policy)}</td>"
-        f"<td>{status.documents}</td>"
-        f"<td>{status.chunks}</td>"
-        "</tr>"
-        for status in indexes
-    )
-    results_html = ""
-    if context.query_results is not None:
-        if not context.query_results:
-            results_html = "<p>No matches found.</p>"
-        else:
-            rows = []
-            for score, record in context.query_results:
-                preview = html.escape(record["text"][:160].replace("\n", " "))
-                rows.append(
-                    f"<li><strong>{html.escape(record['chunk_id'])}</strong> "
-                    f"<em>{score:.3f}</em> — {preview}</li>"
-                )
-            results_html = "<ol>" + "".join(rows) + "</ol>"
-    message_html = (
-        f"<div class='flash'>{html.escape(context.message)}</div>"
-        if context.message
-        else ""
-    )
-    query_form_indexes = (
-        options_indexes
-        if options_indexes
-        else '<option value="" disabled selected>No indexes yet</option>'
-    )
-    nav = f"""
-    <nav>
-      <a href="/corpus" class="{'active' if view == 'corpus' else ''}">Corpus</a>
-      <a href="/indexes" class="{'active' if view == 'indexes' else ''}">Indexes</a>
-    </nav>
-    """
+        # Snapshot under the lock; _remember mutates the deque from other threads.
+        with app._state_lock:
+            display_docs = list(app._recent)
+        display_docs.reverse()
+        shown_count = len(display_docs)
+    more_count = max(total_docs - shown_count, 0)
+    esc = _esc
+    doc_parts: List[str] = []
+    for doc in display_docs:
+        doc_parts.append(
+            f"<li><strong>{esc(doc.doc_id)}</strong> — {esc(doc.kind)} ({esc(doc.source)})"
+        )
+        if doc.description:
+            doc_parts.append(f" : {esc(doc.description)}")
+        doc_parts.append("</li>")
+    doc_items = "".join(doc_parts)
     corpus_summary = (
-        f"Showing {len(display_docs)} of {len(filtered_docs)} matching documents"
+        f"Showing {shown_count} of {shown_count} matching documents"
         if search_query
-        else f"Showing latest {len(display_docs)} of {len(docs)} documents"
+        else f"Showing latest {shown_count} of {total_docs} documents"
     )
     if more_count and not search_query:
         corpus_summary += f" (and {more_count} more)"
     corpus_page = f"""
       <section>
-        <h2>Corpus ({len(docs)} docs)</h2>
+        <h2>Corpus ({total_docs} docs)</h2>
         <form method="get" action="/corpus" class="search-form">
           <label for="doc_search">Search file names</label>
           <input type="text" id="doc_search" name="q" placeholder="doc id or description" value="{html.escape(search_query)}" />
@@ -298,6 +648,37 @@ def _render_page(app: UXApplication, context: UXContext | None = None) -> str:
         </form>
       </section>
     """
+    return corpus_page
+
+
+def _render_indexes(app: UXApplication, context: UXContext) -> str:
+    esc = _esc
+    results_html = ""
+    if context.query_results is not None:
+        if not context.query_results:
+            results_html = "<p>No matches found.</p>"
+        else:
+            rows = ["<ol>"]
+            for score, record in context.query_results:
+                preview = esc(record["text"][:160].replace("\n", " "))
+                rows.append(
+                    f"<li><strong>{esc(record['chunk_id'])}</strong> "
+                    f"<em>{score:.3f}</em> — {preview}</li>"
+                )
+            rows.append("</ol>")
+            results_html = "".join(rows)
+    index_rows, options_indexes = app.index_listing()
+    if context.query_index:
+        # Only the selected attribute differs from the cached option list.
+        name = esc(context.query_index)
+        options_indexes = options_indexes.replace(
+            f'<option value="{name}" >', f'<option value="{name}" selected>', 1
+        )
+    query_form_indexes = (
+        options_indexes
+        if options_indexes
+        else '<option value="" disabled selected>No indexes yet</option>'
+    )
     indexes_page = f"""
       <section>
         <h2>Indexes</h2>
@@ -359,100 +740,144 @@ def _render_page(app: UXApplication, context: UXContext | None = None) -> str:
         {results_html or '<p>Run a query to see matches.</p>'}
       </section>
     """
-    body_content = corpus_page if view == "corpus" else indexes_page
-    return f"""
-    <!doctype html>
-    <html lang="en">
-    <head>
-      <meta charset="utf-8" />
-      <title>Text Chunking Playground</title>
-      <style>
-        body {{ font-family: sans-serif; margin: 2rem; max-width: 960px; }}
-        section {{ margin-bottom: 2rem; }}
-        textarea {{ width: 100%; min-height: 140px; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 0.5rem; text-align: left; }}
-        th {{ background: #f0f0f0; }}
-        .flash {{ padding: 0.75rem; background: #eef; border: 1px solid #aac; margin-bottom: 1rem; }}
-        .forms {{ display: grid; gap: 1.5rem; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); }}
-        form {{ border: 1px solid #ddd; padding: 1rem; border-radius: 6px; background: #fafafa; }}
-        label {{ display: block; font-weight: 600; margin-top: 0.5rem; }}
-        input[type=text], select {{ width: 100%; padding: 0.4rem; }}
-        button {{ margin-top: 0.75rem; padding: 0.5rem 0.75rem; }}
-        nav {{ margin-bottom: 1.5rem; }}
-        nav a {{ margin-right: 1rem; text-decoration: none; font-weight: 600; color: #555; }}
-        nav a.active {{ color: #000; text-decoration: underline; }}
-        .note {{ font-size: 0.85rem; color: #555; margin: 0.2rem 0 0.6rem; }}
-        .search-form {{ display: flex; flex-wrap: wrap; gap: 0.5rem; align-items: center; margin: 0 0 0.5rem; }}
-        .search-form input {{ flex: 1; min-width: 200px; padding: 0.4rem; }}
-        .search-form label {{ margin: 0; }}
-        .search-form .clear {{ font-size: 0.85rem; color: #0070f3; text-decoration: none; }}
-        .corpus-meta {{ font-size: 0.9rem; color: #555; margin-bottom: 0.5rem; }}
-      </style>
-    </head>
-    <body>
-      <h1>Text Chunking Playground</h1>
-      {nav}
-      {message_html}
-      {body_content}
-    </body>
-    <script>
-      document.addEventListener('DOMContentLoaded', function() {{
-        const picker = document.getElementById('picker');
-        const manual = document.getElementById('manual_path');
-        if (picker && manual) {{
-          picker.addEventListener('change', () => {{
-            if (!picker.files || picker.files.length === 0) {{
-              return;
-            }}
-            const first = picker.files[0];
-            if (first.webkitRelativePath) {{
-              manual.value = '';
-              return;
-            }}
-            manual.value = first.name;
-          }});
-        }}
-      }});
-    </script>
-    </html>
+    return indexes_page
+
+
+def _render_body(app: UXApplication, context: UXContext) -> str:
+    if (context.view or "corpus") == "corpus":
+        return _render_corpus(app, context)
+    return _render_indexes(app, context)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_static_body(
+    app: UXApplication, view: str, search_query: str, corpus_rev: int, index_rev: int
+) -> bytes:
+    """Encoded body of a plain GET; the revisions in the key retire stale entries."""
+    return _render_body(app, UXContext(view=view, search_query=search_query)).encode("utf-8")
+
+
+def _render_page(app: UXApplication, context: UXContext | None = None) -> List[bytes]:
+    """Return the page as byte chunks; only the message and body vary per request."""
+    context = context or UXContext()
+    view = context.view or "corpus"
+    has_query_state = (
+        context.query_results is not None
+        or context.query_index is not None
+        or context.query_text is not None
+        or context.query_min_score is not None
+    )
+    if has_query_state:
+        body = _render_body(app, context).encode("utf-8")
+    else:
+        body = _render_static_body(
+            app,
+            view,
+            (context.search_query or "").strip(),
+            app._corpus_rev,
+            app._index_rev,
+        )
+    return _render_shell(view, context.message, body)
+
+
+def _render_shell(view: str, message: Optional[str], body: bytes) -> List[bytes]:
+    """Wrap ``body`` in the static page head, nav and flash message."""
+    message_html = (
+        f"<div class='flash'>{html.escape(message)}</div>".encode("utf-8")
+        if message
+        else b""
+    )
+    nav = _NAV_CORPUS if view == "corpus" else _NAV_INDEXES
+    return [_STATIC_HEAD, nav, _GAP, message_html, _GAP, body, _STATIC_TAIL]
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that hands connections to a fixed set of worker threads.
+
+    Workers are daemon threads, as ThreadingHTTPServer's per-connection threads
+    are, and ``server_close`` shuts down connections still open (idle keep-alive
+    sockets included) so stopping the server does not wait on clients.
     """
 
+    def __init__(self, server_address, handler_class, max_workers: Optional[int] = None) -> None:
+        super().__init__(server_address, handler_class)
+        self._pending: "queue.SimpleQueue[Optional[Tuple[socket.socket, object]]]" = (
+            queue.SimpleQueue()
+        )
+        self._open_requests: set = set()
+        self._open_lock = threading.Lock()
+        # Idle connections pin workers until the handler timeout, so keep a
+        # floor independent of the CPU count (the work is I/O-bound anyway).
+        workers = max_workers or max(_MIN_HTTP_WORKERS, min(64, (os.cpu_count() or 1) * 4))
+        self._workers = [
+            threading.Thread(target=self._serve_pending, name=f"ux-http-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request, client_address) -> None:
+        self._pending.put((request, client_address))
+
+    def _serve_pending(self) -> None:
+        while (item := self._pending.get()) is not None:
+            request, client_address = item
+            with self._open_lock:
+                self._open_requests.add(request)
+            try:
+                self.process_request_thread(request, client_address)
+            finally:
+                with self._open_lock:
+                    self._open_requests.discard(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        for _ in self._workers:
+            self._pending.put(None)
+        with self._open_lock:
+            open_requests = list(self._open_requests)
+        for request in open_requests:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
 
 class UXRequestHandler(BaseHTTPRequestHandler):
     app: UXApplication | None = None
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate sends; with Nagle on, a reused
+    # connection stalls each response on the client's delayed ACK.
+    disable_nagle_algorithm = True
+    # A connection holds its pool worker while idle (before its first request
+    # or between keep-alive requests); release it quickly.
+    timeout = 5
 
     # ------------------------------------------------------------------
-    def _parse_form(self) -> Tuple[Dict[str, str], Dict[str, List[Dict[str, bytes]]]]:
+    def _parse_form(self) -> Tuple[Dict[str, str], Dict[str, List[Tuple[str, Path]]]]:
+        try:
+            return self._read_form()
+        except Exception:
+            # The body may be only partly read; do not reuse the connection.
+            self.close_connection = True
+            raise
+
+    def _read_form(self) -> Tuple[Dict[str, str], Dict[str, List[Tuple[str, Path]]]]:
         length = int(self.headers.get("Content-Length", "0"))
         if length <= 0:
             return {}, {}
-        raw = self.rfile.read(length)
         content_type = self.headers.get("Content-Type", "")
         if content_type.startswith("multipart/form-data"):
             header = f"Content-Type: {content_type}\r\n\r\n".encode("utf-8")
-            message = BytesParser(policy=email_policy).parsebytes(header + raw)
-            fields: Dict[str, str] = {}
-            files: Dict[str, List[Dict[str, bytes]]] = {}
-            for part in message.iter_parts():
-                if part.get_content_disposition() != "form-data":
-                    continue
-                name = part.get_param("name", header="content-disposition")
-                if not name:
-                    continue
-                filename = part.get_filename()
-                payload = part.get_payload(decode=True) or b""
-                if filename:
-                    files.setdefault(name, []).append(
-                        {"filename": filename, "content": payload}
-                    )
-                else:
-                    charset = part.get_content_charset() or "utf-8"
-                    fields[name] = payload.decode(charset)
-            return fields, files
-        data = raw.decode("utf-8")
-        parsed = urllib.parse.parse_qs(data)
-        return {key: values[0] for key, values in parsed.items()}, {}
+            boundary = _parse_headers(header).get_boundary()
+            if not boundary:
+                raise ValueError("Multipart body is missing its boundary")
+            return _parse_multipart_stream(
+                self.rfile, boundary, length, self.app.inline_dir
+            )
+        raw = self.rfile.read(length)
+        data = raw.decode("utf-8", errors="replace")
+        return dict(urllib.parse.parse_qsl(data, keep_blank_values=True)), {}
 
     def _redirect(self, path: str, message: Optional[str] = None) -> None:
         location = path
@@ -461,16 +886,47 @@ class UXRequestHandler(BaseHTTPRequestHandler):
             location = f"{location}{sep}" + urllib.parse.urlencode({"message": message})
         self.send_response(HTTPStatus.SEE_OTHER)
         self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self._send_connection_header()
         self.end_headers()
 
-    def _render(self, context: UXContext | None = None) -> None:
-        content = _render_page(self.app, context)
-        payload = content.encode("utf-8")
+    def _send_connection_header(self) -> None:
+        self.send_header("Connection", "close" if self.close_connection else "keep-alive")
+
+    def _etag(self, context: UXContext) -> str:
+        """Weak validator for a plain GET of ``context``, derived from the revisions."""
+        app = self.app
+        variant = hashlib.blake2b(
+            f"{(context.search_query or '').strip()}\0{context.message or ''}".encode("utf-8"),
+            digest_size=8,
+        ).hexdigest()
+        view = context.view or "corpus"
+        return f'W/"{_ETAG_TOKEN}.{app._corpus_rev}.{app._index_rev}.{view}.{variant}"'
+
+    def _is_not_modified(self, etag: str) -> bool:
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        # Weak comparison: the W/ prefix does not matter.
+        opaque = etag[2:]
+        for candidate in header.split(","):
+            candidate = candidate.strip()
+            if candidate == "*" or candidate.removeprefix("W/") == opaque:
+                return True
+        return False
+
+    def _render(self, context: UXContext | None = None, *, etag: Optional[str] = None) -> None:
+        chunks = _render_page(self.app, context)
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Content-Length", str(sum(map(len, chunks))))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self._send_connection_header()
         self.end_headers()
-        self.wfile.write(payload)
+        # One send for the body; the static chunks are still shared, only joined.
+        self.wfile.write(b"".join(chunks))
 
     def do_GET(self) -> None:  # noqa: N802
         parsed = urllib.parse.urlparse(self.path)
@@ -485,14 +941,24 @@ class UXRequestHandler(BaseHTTPRequestHandler):
         message = params.get("message", [None])[0]
         view = "corpus" if path == "/corpus" else "indexes"
         search_query = params.get("q", [None])[0] if view == "corpus" else None
-        self._render(UXContext(message=message, view=view, search_query=search_query))
+        context = UXContext(message=message, view=view, search_query=search_query)
+        etag = self._etag(context)
+        if self._is_not_modified(etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self._send_connection_header()
+            self.end_headers()
+            return
+        self._render(context, etag=etag)
 
     def do_POST(self) -> None:  # noqa: N802
         if not self.app:
             self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, "App not configured")
             return
-        form, files = self._parse_form()
+        files: Dict[str, List[Tuple[str, Path]]] = {}
         try:
+            form, files = self._parse_form()
             if self.path == "/documents":
                 doc_id = self.app.create_document(form.get("content", ""))
                 self._redirect("/corpus", message=f"Document {doc_id} saved.")
@@ -500,11 +966,8 @@ class UXRequestHandler(BaseHTTPRequestHandler):
             if self.path == "/uploads":
                 uploaded_files = files.get("file", [])
                 uploaded_count = 0
-                for upload in uploaded_files:
-                    doc_id = self.app.upload_file(
-                        upload["filename"],
-                        upload["content"],
-                    )
+                for filename, spooled in uploaded_files:
+                    self.app.upload_file(filename, spooled)
                     uploaded_count += 1
                 path_value = form.get("manual_path", "").strip()
                 registered_count = 0
@@ -533,7 +996,9 @@ class UXRequestHandler(BaseHTTPRequestHandler):
                 doc_id = self.app.register_url(
                     form.get("url", "")
                 )
-                self._redirect("/corpus", message=f"Document {doc_id} registered from URL.")
+                self._redirect(
+                    "/corpus", message=f"Document {doc_id} registered; downloading in the background."
+                )
                 return
             if self.path == "/indexes":
                 documents = form.get("documents") or ""
@@ -582,6 +1047,8 @@ class UXRequestHandler(BaseHTTPRequestHandler):
             self.send_error(HTTPStatus.NOT_FOUND, "Unknown endpoint")
         except Exception as exc:  # pragma: no cover - interactive UX
             self._render(UXContext(message=f"Error: {exc}"))
+        finally:
+            _discard_uploads(files)
 
 
 def run_server(
@@ -593,7 +1060,7 @@ def run_server(
     corpus_root = corpus or Path(__file__).resolve().parents[2] / "data"
     app = UXApplication(corpus_root)
     UXRequestHandler.app = app
-    server = ThreadingHTTPServer((host, port), UXRequestHandler)
+    server = PooledHTTPServer((host, port), UXRequestHandler)
     print(f"Serving UX on http://{host}:{port}")
     try:
         server.serve_forever()
@@ -601,6 +1068,7 @@ def run_server(
         print("\nShutting down...")
     finally:
         server.server_close()
+        app.close()
 
 
 def main(argv: Optional[List[str]] = None) -> None: